@@ -18,7 +18,7 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.SWITCH, Platform.SENSOR]
+PLATFORMS: tuple[Platform, ...] = (Platform.SWITCH, Platform.SENSOR)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: DriftBeaconConfigEntry) -> bool:
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import logging
+import socket
 from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 import voluptuous as vol
@@ -14,6 +17,8 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_AUTH_CREATE_SERVER_SESSION,
@@ -31,13 +36,25 @@ from .const import (
     DEFAULT_HOST,
     DEFAULT_PORT,
     DETECTION_CANDIDATES,
+    DETECTION_RESOLVE_TIMEOUT,
     DETECTION_TIMEOUT,
     DOMAIN,
-    PROTOCOL_DETECTION_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# ClientTimeout is immutable, so share one instance per timeout value
+_DETECTION_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=DETECTION_TIMEOUT)
+_API_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT)
+
+
+@lru_cache(maxsize=8)
+def _webui_url_for_ip(source_ip: str) -> str:
+    """Build the web UI URL for a source IP."""
+    # Transform 10.0.0.193 to 10-0-0-193
+    ip_with_dashes = source_ip.replace(".", "-")
+    return f"http://{ip_with_dashes}.local.driftbeacon.net:9000"
+
 
 class InvalidAuthError(Exception):
     """Error to indicate authentication failure."""
@@ -68,9 +85,15 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
         if self._webui_url is None:
             self._webui_url = await self._get_webui_url()
 
-        # Detect local hub if not already done
+        # Detect local hub if not already done. Probes run concurrently, so one
+        # detection window (plus slack) bounds how long the form can be delayed.
         if self._detected_hub is None:
-            self._detected_hub = await self._detect_local_addon()
+            try:
+                self._detected_hub = await asyncio.wait_for(
+                    self._detect_local_addon(), timeout=DETECTION_TIMEOUT + 1
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.debug("Local add-on detection timed out")
 
         if user_input is not None:
             host = user_input[CONF_HOST]
@@ -128,14 +151,9 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
         if self._detected_hub:
             detected_info = f"✓ Local add-on detected at {self._detected_hub['url']}"
             # Parse detected URL (protocol already included)
-            url_parts = (
-                self._detected_hub["url"]
-                .replace("https://", "")
-                .replace("http://", "")
-                .split(":")
-            )
-            default_host = url_parts[0]
-            default_port = int(url_parts[1]) if len(url_parts) > 1 else DEFAULT_PORT
+            url_parts = urlsplit(self._detected_hub["url"])
+            default_host = url_parts.hostname or DEFAULT_HOST
+            default_port = url_parts.port or DEFAULT_PORT
 
         # Show form
         return self.async_show_form(
@@ -240,11 +258,11 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
 
             async with session.get(
                 url,
-                timeout=aiohttp.ClientTimeout(total=DETECTION_TIMEOUT),
+                timeout=_DETECTION_CLIENT_TIMEOUT,
                 ssl=False,  # Don't verify SSL during detection
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     return data
         except Exception as err:  # noqa: BLE001
             _LOGGER.debug("Failed to connect via %s: %s", protocol, err)
@@ -296,7 +314,7 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
         if pending:
             for task in pending:
                 try:
-                    result = await task
+                    result = await asyncio.wait_for(task, timeout=DETECTION_TIMEOUT)
                     if result is not None:
                         protocol = "https" if task == https_task else "http"
                         _LOGGER.debug(
@@ -318,37 +336,91 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
         try:
             source_ip = await async_get_source_ip(self.hass)
             if source_ip:
-                # Transform 10.0.0.193 to 10-0-0-193
-                ip_with_dashes = source_ip.replace(".", "-")
-                webui_url = f"http://{ip_with_dashes}.local.driftbeacon.net:9000"
+                webui_url = _webui_url_for_ip(source_ip)
                 _LOGGER.debug("Generated webui URL: %s", webui_url)
                 return webui_url
         except Exception as err:  # noqa: BLE001
             _LOGGER.warning("Failed to get webui URL: %s", err)
         return None
 
+    async def _resolvable_candidates(self) -> list[tuple[str, int]]:
+        """Return detection candidates whose hostnames resolve on this host.
+
+        The result is cached in hass.data so later flows skip the lookups.
+        """
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        if (candidates := domain_data.get("resolved_candidates")) is not None:
+            return candidates
+
+        async def resolves(host: str, port: int) -> bool:
+            try:
+                await asyncio.wait_for(
+                    self.hass.loop.getaddrinfo(
+                        host, port, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+                    ),
+                    timeout=DETECTION_RESOLVE_TIMEOUT,
+                )
+            except (OSError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Skipping unresolvable candidate %s: %s", host, err)
+                return False
+            return True
+
+        results = await asyncio.gather(
+            *(resolves(host, port) for host, port in DETECTION_CANDIDATES)
+        )
+        candidates = [
+            candidate
+            for candidate, resolved in zip(DETECTION_CANDIDATES, results)
+            if resolved
+        ]
+        domain_data["resolved_candidates"] = candidates
+        return candidates
+
     async def _detect_local_addon(self) -> dict[str, Any] | None:
         """Detect if local Drift Beacon add-on is available.
 
-        Uses parallel protocol detection for fast, zero-penalty discovery.
+        Probes every resolvable candidate over both protocols in parallel - the
+        first successful response wins and the remaining probes are cancelled.
         """
-        for host, port in DETECTION_CANDIDATES:
+        tasks: dict[asyncio.Task[dict[str, Any] | None], tuple[str, str, int]] = {}
+        for host, port in await self._resolvable_candidates():
             _LOGGER.debug("Checking for Drift Beacon at %s:%s", host, port)
+            for protocol in ("https", "http"):
+                task = asyncio.create_task(
+                    self._try_protocol(protocol, host, port, API_SYSTEM_STATUS)
+                )
+                tasks[task] = (protocol, host, port)
 
-            result = await self._detect_protocol_parallel(host, port)
-
-            if result:
-                protocol, data = result
-                url = f"{protocol}://{host}:{port}"
-                _LOGGER.info(
-                    "Detected Drift Beacon at %s: %s", url, data["device"]["name"]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                return {
-                    "protocol": protocol,
-                    "url": url,
-                    "id": data["device"]["id"],
-                    "name": data["device"]["name"],
-                }
+
+                # Prefer candidates in declaration order if several finished
+                for task in [candidate for candidate in tasks if candidate in done]:
+                    data = task.result()
+                    if data is None:
+                        continue
+
+                    protocol, host, port = tasks[task]
+                    url = f"{protocol}://{host}:{port}"
+                    _LOGGER.info(
+                        "Detected Drift Beacon at %s: %s", url, data["device"]["name"]
+                    )
+                    return {
+                        "protocol": protocol,
+                        "url": url,
+                        "id": data["device"]["id"],
+                        "name": data["device"]["name"],
+                    }
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # The add-on may be installed later, so don't keep a list that missed
+        self.hass.data[DOMAIN].pop("resolved_candidates", None)
 
         _LOGGER.debug("No local Drift Beacon add-on detected")
         return None
@@ -373,69 +445,102 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
         Returns:
             Dict containing auth data including detected/used protocol
         """
-        # If protocol not specified, try HTTPS first with quick timeout
+        hub_info: dict[str, Any] | None = None
+
+        # If protocol not specified, race HTTPS and HTTP on the status endpoint.
+        # Only the unauthenticated probe is raced so credentials are sent once.
         if protocol is None:
             _LOGGER.debug("Auto-detecting protocol for %s:%s", host, port)
 
-            # Try HTTPS first (more secure) with short timeout
-            try:
-                result = await asyncio.wait_for(
-                    self._do_auth("https", host, port, email, password),
-                    timeout=PROTOCOL_DETECTION_TIMEOUT,
-                )
-                result["protocol"] = "https"
-                return result
-            except (
-                asyncio.TimeoutError,
-                aiohttp.ClientSSLError,
-                aiohttp.ClientConnectorError,
-            ) as err:
-                _LOGGER.debug("HTTPS failed, trying HTTP: %s", err)
-
-            # Fallback to HTTP
-            protocol = "http"
+            detected = await self._detect_protocol_parallel(host, port)
+            if detected is not None:
+                protocol, hub_info = detected
+            else:
+                # Neither probe got a 200; fetch the status again without
+                # swallowing errors so the form reports the real failure
+                try:
+                    hub_info = await self._fetch_hub_info("https", host, port)
+                    protocol = "https"
+                except (
+                    asyncio.TimeoutError,
+                    aiohttp.ClientSSLError,
+                    aiohttp.ClientConnectorError,
+                ) as err:
+                    _LOGGER.debug("HTTPS failed, trying HTTP: %s", err)
+                    hub_info = await self._fetch_hub_info("http", host, port)
+                    protocol = "http"
 
         # Use specified or detected protocol
-        result = await self._do_auth(protocol, host, port, email, password)
+        result = await self._do_auth(
+            protocol, host, port, email, password, hub_info=hub_info
+        )
         result["protocol"] = protocol
         return result
 
+    async def _fetch_hub_info(
+        self, protocol: str, host: str, port: int
+    ) -> dict[str, Any]:
+        """Get hub identity from the status endpoint, raising on any error."""
+        url = f"{protocol}://{host}:{port}{API_SYSTEM_STATUS}"
+        _LOGGER.debug("Getting hub identity from %s", url)
+        session = async_get_clientsession(self.hass)
+        async with session.get(
+            url,
+            timeout=_API_CLIENT_TIMEOUT,
+            ssl=False,  # Don't verify SSL
+        ) as response:
+            response.raise_for_status()
+            return await response.json(loads=json_loads)
+
     async def _do_auth(
-        self, protocol: str, host: str, port: int, email: str, password: str
+        self,
+        protocol: str,
+        host: str,
+        port: int,
+        email: str,
+        password: str,
+        *,
+        hub_info: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Perform authentication flow with specified protocol.
 
         This is the core authentication logic separated for testability.
+        hub_info is the status payload when protocol detection already has it.
         """
         base_url = f"{protocol}://{host}:{port}"
 
-        # Create temporary session with cookie jar ONLY for this auth flow
+        # Create temporary session with cookie jar ONLY for this auth flow,
+        # sharing HA's pooled connector so connections can be kept alive
+        shared_session = async_get_clientsession(self.hass)
         async with aiohttp.ClientSession(
-            cookie_jar=aiohttp.CookieJar()
+            connector=shared_session.connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.CookieJar(),
+            json_serialize=json_dumps,
         ) as temp_session:
 
-            # Step 1: Get hub identity
-            _LOGGER.debug("Getting hub identity from %s", base_url)
-            async with temp_session.get(
-                f"{base_url}{API_SYSTEM_STATUS}",
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
-                ssl=False,  # Don't verify SSL
-            ) as response:
-                response.raise_for_status()
-                hub_info = await response.json()
-
-            # Step 2: Sign in - cookie automatically stored in jar
-            _LOGGER.debug("Signing in as %s", email)
-            async with temp_session.post(
-                f"{base_url}{API_AUTH_SIGN_IN}",
-                json={"email": email, "password": password},
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
-                ssl=False,
-            ) as response:
-                if response.status == 401:
-                    raise InvalidAuthError("Invalid credentials")
-                response.raise_for_status()
-                user_data = await response.json()
+            async def sign_in() -> dict[str, Any]:
+                """Step 2: Sign in - cookie automatically stored in jar."""
+                _LOGGER.debug("Signing in as %s", email)
+                async with temp_session.post(
+                    f"{base_url}{API_AUTH_SIGN_IN}",
+                    json={"email": email, "password": password},
+                    timeout=_API_CLIENT_TIMEOUT,
+                    ssl=False,
+                ) as response:
+                    if response.status == 401:
+                        raise InvalidAuthError("Invalid credentials")
+                    response.raise_for_status()
+                    return await response.json(loads=json_loads)
+
+            # Step 1: Get hub identity, unless detection already fetched it.
+            # Steps 1 and 2 are independent, so save a round trip.
+            if hub_info is None:
+                hub_info, user_data = await asyncio.gather(
+                    self._fetch_hub_info(protocol, host, port), sign_in()
+                )
+            else:
+                user_data = await sign_in()
 
             # Step 3: Create server session - cookie automatically sent
             server_id = (
@@ -450,13 +555,13 @@ class DriftBeaconConfigFlow(ConfigFlow, domain=DOMAIN):
                     "serverName": "Home Assistant",
                     "expiresInDays": 365,
                 },
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+                timeout=_API_CLIENT_TIMEOUT,
                 ssl=False,
             ) as response:
                 if response.status == 401:
                     raise SessionCreationError("Failed to create server session")
                 response.raise_for_status()
-                session_data = await response.json()
+                session_data = await response.json(loads=json_loads)
 
             _LOGGER.info(
                 "Successfully authenticated %s and created server session", email
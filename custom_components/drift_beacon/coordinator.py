@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
+from functools import cached_property
 import logging
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TypedDict
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_ACTIVITIES,
+    API_BOOTSTRAP,
     API_LIVE_SESSION,
     API_START_SESSION,
     API_STOP_SESSION,
@@ -29,6 +35,7 @@ from .const import (
     EVENT_SESSION_CHANGED,
     EVENT_SESSION_STARTED,
     EVENT_SESSION_STOPPED,
+    REQUEST_REFRESH_COOLDOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,6 +67,7 @@ class Session(TypedDict):
     end_time: str | None
     workspace_id: str
     workspace_name: str
+    _start_time_dt: NotRequired[datetime]
 
 
 class DriftBeaconData(TypedDict):
@@ -67,6 +75,7 @@ class DriftBeaconData(TypedDict):
 
     activities: list[Activity]
     live_sessions: list[Session]
+    _now_utc: datetime
 
 
 type DriftBeaconConfigEntry = ConfigEntry[DriftBeaconDataUpdateCoordinator]
@@ -84,39 +93,125 @@ class DriftBeaconDataUpdateCoordinator(DataUpdateCoordinator[DriftBeaconData]):
         self.port = entry.data[CONF_PORT]
         self.protocol = entry.data.get(CONF_PROTOCOL, "https")  # Default to https for backward compat
         self.base_url = f"{self.protocol}://{self.host}:{self.port}"
-        self.session = async_get_clientsession(hass)
+        # Full URLs for the fixed set of endpoints polled and posted to
+        self._urls = {
+            endpoint: f"{self.base_url}{endpoint}"
+            for endpoint in (
+                API_BOOTSTRAP,
+                API_ACTIVITIES,
+                API_LIVE_SESSION,
+                API_START_SESSION,
+                API_STOP_SESSION,
+            )
+        }
+        # Own session so the self-signed SSL and timeout defaults apply to every
+        # request, while still pooling keep-alive connections in HA's connector
+        self.session = async_create_clientsession(
+            hass,
+            verify_ssl=False,  # Local add-on uses self-signed certs
+            auto_cleanup=False,
+            timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+        )
+        entry.async_on_unload(self.session.close)
+        self._auth_headers = {"Authorization": f"Bearer {self.session_token}"}
+        # Parsed session start times keyed by their raw ISO string
+        self._start_times: dict[str, datetime] = {}
+        # Older servers lack the combined endpoint; switch off once it is missing
+        self._bootstrap_supported = True
+        # (session ID, activity ID) pairs from the last refresh that fired events
+        self._last_session_sig: frozenset[tuple[str, str | None]] | None = None
+        # Sessions as last fetched from the server. Events are diffed against
+        # these rather than self.data, which may hold optimistic updates.
+        self._polled_sessions: list[Session] = []
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # start_session/stop_session request a refresh after every toggle;
+            # coalesce a burst of them (and update_entity calls) into one
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
+        # Start from empty data so readers never need a None check
+        self.data = {
+            "activities": [],
+            "live_sessions": [],
+            "_now_utc": dt_util.utcnow(),
+        }
+
+    @cached_property
+    def activities_by_id(self) -> dict[str, Activity]:
+        """Return activities indexed by ID."""
+        return {activity["id"]: activity for activity in self.data["activities"]}
+
+    @cached_property
+    def sessions_by_workspace(self) -> dict[str, Session]:
+        """Return live sessions indexed by workspace ID."""
+        return {
+            session["workspace_id"]: session for session in self.data["live_sessions"]
+        }
+
+    @cached_property
+    def sessions_by_activity_id(self) -> dict[str, Session]:
+        """Return live sessions indexed by activity ID."""
+        return {
+            session["activity_id"]: session
+            for session in self.data["live_sessions"]
+            if session.get("activity_id")
+        }
+
+    @cached_property
+    def workspaces(self) -> dict[str, str]:
+        """Return workspace names indexed by workspace ID."""
+        return {
+            activity["workspace_id"]: activity["workspace_name"]
+            for activity in self.data["activities"]
+            if activity.get("workspace_id") and activity.get("workspace_name")
+        }
+
+    def _invalidate_indices(self) -> None:
+        """Drop cached indices so they are rebuilt on next access."""
+        self.__dict__.pop("activities_by_id", None)
+        self.__dict__.pop("sessions_by_workspace", None)
+        self.__dict__.pop("sessions_by_activity_id", None)
+        self.__dict__.pop("workspaces", None)
+
     async def _make_authenticated_request(
-        self, method: str, endpoint: str, **kwargs: Any
+        self, method: str, endpoint: str, *, allow_missing: bool = False, **kwargs: Any
     ) -> Any:
-        """Make authenticated API request with Bearer token."""
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {self.session_token}"
+        """Make authenticated API request with Bearer token.
+
+        With allow_missing, a 404 or 405 response, or a response that is not
+        JSON (such as the web UI's HTML), returns None instead of raising.
+        """
+        # Only copy the shared auth headers when the caller adds its own
+        extra_headers = kwargs.pop("headers", None)
+        headers = (
+            self._auth_headers
+            if extra_headers is None
+            else {**self._auth_headers, **extra_headers}
+        )
 
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
 
         try:
             async with self.session.request(
-                method,
-                url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
-                ssl=False,  # Disable SSL verification for local add-on with self-signed certs
-                **kwargs,
+                method, url, headers=headers, **kwargs
             ) as response:
                 if response.status == 401:
                     raise ConfigEntryAuthFailed(
                         "Authentication failed. Session token expired or invalid."
                     )
+                if allow_missing and response.status in (404, 405):
+                    return None
                 response.raise_for_status()
-                return await response.json()
+                if allow_missing and response.content_type != "application/json":
+                    return None
+                return await response.json(loads=json_loads)
         except ConfigEntryAuthFailed:
             # Re-raise auth failures to trigger reauth flow
             raise
@@ -133,22 +228,33 @@ class DriftBeaconDataUpdateCoordinator(DataUpdateCoordinator[DriftBeaconData]):
         """Fetch data from Drift Beacon API with authentication."""
         try:
             # Store old sessions before fetching new data (for event firing)
-            old_sessions = self.data.get("live_sessions", []) if self.data else []
+            old_sessions = self._polled_sessions
 
-            # Fetch activities and live sessions (now returns array)
-            activities = await self._make_authenticated_request("GET", API_ACTIVITIES)
-            live_sessions = await self._make_authenticated_request(
-                "GET", API_LIVE_SESSION
-            )
+            activities, live_sessions = await self._fetch_activities_and_sessions()
+            self._parse_start_times(live_sessions)
 
             new_data = {
                 "activities": activities,
                 "live_sessions": live_sessions,
+                # Shared "now" so entities don't each read the clock per update
+                "_now_utc": dt_util.utcnow(),
             }
 
-            # Fire events based on session changes
-            self._fire_session_events(old_sessions, live_sessions, activities)
+            # Fire events based on session changes. Only a session starting,
+            # stopping or switching activity fires events, so skip the diff when
+            # none of those happened. The first refresh fires session_started
+            # for sessions already live, which automations rely on to restore
+            # state after a restart or reload.
+            session_sig = frozenset(
+                (session["id"], session.get("activity_id")) for session in live_sessions
+            )
+            if session_sig != self._last_session_sig:
+                self._fire_session_events(old_sessions, live_sessions, activities)
+                self._last_session_sig = session_sig
+            self._polled_sessions = live_sessions
 
+            # Indices are rebuilt lazily from the new data
+            self._invalidate_indices()
             return new_data
 
         except ConfigEntryAuthFailed:
@@ -161,74 +267,165 @@ class DriftBeaconDataUpdateCoordinator(DataUpdateCoordinator[DriftBeaconData]):
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    async def start_session(self, activity_id: str, workspace_id: str) -> bool:
-        """Start a session for an activity."""
-        _LOGGER.debug("Starting session for activity %s in workspace %s", activity_id, workspace_id)
-
-        try:
-            await self._make_authenticated_request(
-                "POST",
-                API_START_SESSION,
-                json={"activityId": activity_id, "workspaceId": workspace_id},
+    async def _fetch_activities_and_sessions(
+        self,
+    ) -> tuple[list[Activity], list[Session]]:
+        """Fetch activities and live sessions, in one request when supported."""
+        if self._bootstrap_supported:
+            bootstrap = await self._make_authenticated_request(
+                "GET", API_BOOTSTRAP, allow_missing=True
             )
+            # The backend serves the web UI on the same port, so a catch-all
+            # route can answer for an endpoint the server does not have
+            if (
+                isinstance(bootstrap, dict)
+                and "activities" in bootstrap
+                and "live_sessions" in bootstrap
+            ):
+                return bootstrap["activities"], bootstrap["live_sessions"]
+
+            _LOGGER.debug("Bootstrap endpoint not available, using separate requests")
+            self._bootstrap_supported = False
+
+        # Fetch activities and live sessions (now returns array) concurrently
+        activities, live_sessions = await asyncio.gather(
+            self._make_authenticated_request("GET", API_ACTIVITIES),
+            self._make_authenticated_request("GET", API_LIVE_SESSION),
+        )
+        return activities, live_sessions
+
+    def _parse_start_times(self, live_sessions: list[Session]) -> None:
+        """Attach parsed start times to sessions, reusing previous parses."""
+        start_times: dict[str, datetime] = {}
+        for session in live_sessions:
+            raw = session.get("start_time")
+            if not raw:
+                continue
+            start_time = self._start_times.get(raw)
+            if start_time is None:
+                try:
+                    start_time = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+                except (ValueError, TypeError) as err:
+                    _LOGGER.debug("Failed to parse session start time %s: %s", raw, err)
+                    continue
+                if start_time.tzinfo is None:
+                    start_time = start_time.replace(tzinfo=dt_util.UTC)
+            start_times[raw] = start_time
+            session["_start_time_dt"] = start_time
+        self._start_times = start_times
 
-            _LOGGER.info("Successfully started session for activity %s", activity_id)
-
-            # Immediately refresh data to update entity states
-            await self.async_request_refresh()
-            return True
-
-        except ConfigEntryAuthFailed:
-            _LOGGER.error("Authentication failed while starting session")
-            # Re-raise to trigger reauth flow
-            raise
-        except aiohttp.ClientResponseError as err:
-            _LOGGER.error(
-                "Failed to start session for activity %s: HTTP %s",
-                activity_id,
-                err.status,
-            )
-            return False
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to start session for activity %s: %s", activity_id, err
-            )
+    async def start_session(self, activity_id: str, workspace_id: str) -> bool:
+        """Start a session for an activity."""
+        if not await self._session_action(
+            API_START_SESSION, "start", activity_id, workspace_id
+        ):
             return False
 
+        # Show the session as started now; the refresh confirms it against the
+        # server and fires the session events
+        self._async_apply_session_started(activity_id, workspace_id)
+        await self.async_request_refresh()
+        return True
+
     async def stop_session(self, activity_id: str, workspace_id: str) -> bool:
         """Stop the current session."""
-        _LOGGER.debug("Stopping session for activity %s in workspace %s", activity_id, workspace_id)
+        if not await self._session_action(
+            API_STOP_SESSION, "stop", activity_id, workspace_id
+        ):
+            return False
+
+        # Drop the session from entity states before the refresh catches up
+        self._async_apply_session_stopped(activity_id)
+        await self.async_request_refresh()
+        return True
+
+    async def _session_action(
+        self, endpoint: str, action: str, activity_id: str, workspace_id: str
+    ) -> bool:
+        """Post a session start/stop request for an activity."""
+        _LOGGER.debug(
+            "Requesting session %s for activity %s in workspace %s",
+            action,
+            activity_id,
+            workspace_id,
+        )
 
         try:
             await self._make_authenticated_request(
                 "POST",
-                API_STOP_SESSION,
+                endpoint,
                 json={"activityId": activity_id, "workspaceId": workspace_id},
             )
-
-            _LOGGER.info("Successfully stopped session for activity %s", activity_id)
-
-            # Immediately refresh data to update entity states
-            await self.async_request_refresh()
-            return True
-
         except ConfigEntryAuthFailed:
-            _LOGGER.error("Authentication failed while stopping session")
+            _LOGGER.error("Authentication failed during session %s", action)
             # Re-raise to trigger reauth flow
             raise
         except aiohttp.ClientResponseError as err:
             _LOGGER.error(
-                "Failed to stop session for activity %s: HTTP %s",
+                "Failed to %s session for activity %s: HTTP %s",
+                action,
                 activity_id,
                 err.status,
             )
             return False
         except Exception as err:
             _LOGGER.error(
-                "Failed to stop session for activity %s: %s", activity_id, err
+                "Failed to %s session for activity %s: %s", action, activity_id, err
             )
             return False
 
+        _LOGGER.info("Session %s succeeded for activity %s", action, activity_id)
+        return True
+
+    @callback
+    def _async_apply_session_started(self, activity_id: str, workspace_id: str) -> None:
+        """Optimistically record a session started for an activity."""
+        now = dt_util.utcnow()
+        live_sessions = []
+        session: Session | None = None
+        for existing in self.data["live_sessions"]:
+            if existing["workspace_id"] == workspace_id:
+                # A workspace has one live session, which switches activity
+                session = {**existing, "activity_id": activity_id}
+            else:
+                live_sessions.append(existing)
+
+        if session is None:
+            activity = self.activities_by_id.get(activity_id)
+            session = {
+                "id": f"pending_{activity_id}",
+                "activity_id": activity_id,
+                "start_time": now.isoformat(),
+                "end_time": None,
+                "workspace_id": workspace_id,
+                "workspace_name": activity["workspace_name"] if activity else "",
+                "_start_time_dt": now,
+            }
+        live_sessions.append(session)
+        self._async_set_live_sessions(live_sessions, now)
+
+    @callback
+    def _async_apply_session_stopped(self, activity_id: str) -> None:
+        """Optimistically remove the live session of an activity."""
+        self._async_set_live_sessions(
+            [
+                session
+                for session in self.data["live_sessions"]
+                if session.get("activity_id") != activity_id
+            ],
+            dt_util.utcnow(),
+        )
+
+    @callback
+    def _async_set_live_sessions(
+        self, live_sessions: list[Session], now: datetime
+    ) -> None:
+        """Publish locally updated live sessions to listeners."""
+        self._invalidate_indices()
+        self.async_set_updated_data(
+            {**self.data, "live_sessions": live_sessions, "_now_utc": now}
+        )
+
     def _fire_session_events(
         self,
         old_sessions: list[Session],
@@ -236,101 +433,103 @@ class DriftBeaconDataUpdateCoordinator(DataUpdateCoordinator[DriftBeaconData]):
         activities: list[Activity],
     ) -> None:
         """Fire events when session state changes across all workspaces."""
-
-        def get_activity(activity_id: str | None) -> Activity | None:
-            """Helper to find activity by ID."""
-            if activity_id is None:
-                return None
-            for activity in activities:
-                if activity["id"] == activity_id:
-                    return activity
-            return None
+        # Index activities once rather than scanning them per session
+        activities_by_id = {activity["id"]: activity for activity in activities}
 
         # Create lookup by session ID for easier comparison
         old_sessions_by_id = {s["id"]: s for s in old_sessions}
         new_sessions_by_id = {s["id"]: s for s in new_sessions}
+        old_ids = old_sessions_by_id.keys()
+        new_ids = new_sessions_by_id.keys()
+
+        # Set differences pick the sessions; iterating the lists keeps events
+        # in the server's order
+        started_ids = new_ids - old_ids
+        stopped_ids = old_ids - new_ids
 
         # Detect new sessions (started)
         for new_session in new_sessions:
-            if new_session["id"] not in old_sessions_by_id:
-                activity = get_activity(new_session.get("activity_id"))
-                if activity:
-                    _LOGGER.debug(
-                        "Firing session_started event for activity %s in workspace %s",
-                        activity["name"],
-                        new_session["workspace_name"]
-                    )
-                    self.hass.bus.async_fire(
-                        EVENT_SESSION_STARTED,
-                        {
-                            "activity_id": activity["id"],
-                            "activity_name": activity["name"],
-                            "color": activity["color"],
-                            "icon": activity["icon"],
-                            "category_id": activity.get("category_id"),
-                            "category_name": activity.get("category_name"),
-                            "category_icon": activity.get("category_icon"),
-                            "category_color": activity.get("category_color"),
-                            "workspace_id": new_session["workspace_id"],
-                            "workspace_name": new_session["workspace_name"],
-                            "session_start_time": new_session["start_time"],
-                        },
-                    )
+            if new_session["id"] not in started_ids:
+                continue
+            activity = activities_by_id.get(new_session.get("activity_id"))
+            if activity:
+                _LOGGER.debug(
+                    "Firing session_started event for activity %s in workspace %s",
+                    activity["name"],
+                    new_session["workspace_name"]
+                )
+                self.hass.bus.async_fire(
+                    EVENT_SESSION_STARTED,
+                    {
+                        "activity_id": activity["id"],
+                        "activity_name": activity["name"],
+                        "color": activity["color"],
+                        "icon": activity["icon"],
+                        "category_id": activity.get("category_id"),
+                        "category_name": activity.get("category_name"),
+                        "category_icon": activity.get("category_icon"),
+                        "category_color": activity.get("category_color"),
+                        "workspace_id": new_session["workspace_id"],
+                        "workspace_name": new_session["workspace_name"],
+                        "session_start_time": new_session["start_time"],
+                    },
+                )
 
         # Detect stopped sessions
         for old_session in old_sessions:
-            if old_session["id"] not in new_sessions_by_id:
-                activity = get_activity(old_session.get("activity_id"))
-                if activity:
+            if old_session["id"] not in stopped_ids:
+                continue
+            activity = activities_by_id.get(old_session.get("activity_id"))
+            if activity:
+                _LOGGER.debug(
+                    "Firing session_stopped event for activity %s in workspace %s",
+                    activity["name"],
+                    old_session["workspace_name"]
+                )
+                self.hass.bus.async_fire(
+                    EVENT_SESSION_STOPPED,
+                    {
+                        "activity_id": old_session["activity_id"],
+                        "activity_name": activity["name"],
+                        "workspace_id": old_session["workspace_id"],
+                        "workspace_name": old_session["workspace_name"],
+                    },
+                )
+
+        # Detect changed sessions (same session ID, different activity)
+        for new_session in new_sessions:
+            old_session = old_sessions_by_id.get(new_session["id"])
+            if old_session is None:
+                continue
+
+            if old_session.get("activity_id") != new_session.get("activity_id"):
+                old_activity = activities_by_id.get(old_session.get("activity_id"))
+                new_activity = activities_by_id.get(new_session.get("activity_id"))
+
+                if new_activity:
                     _LOGGER.debug(
-                        "Firing session_stopped event for activity %s in workspace %s",
-                        activity["name"],
-                        old_session["workspace_name"]
+                        "Firing session_changed event in workspace %s: %s -> %s",
+                        new_session["workspace_name"],
+                        old_activity["name"] if old_activity else "unknown",
+                        new_activity["name"],
                     )
                     self.hass.bus.async_fire(
-                        EVENT_SESSION_STOPPED,
+                        EVENT_SESSION_CHANGED,
                         {
-                            "activity_id": old_session["activity_id"],
-                            "activity_name": activity["name"],
-                            "workspace_id": old_session["workspace_id"],
-                            "workspace_name": old_session["workspace_name"],
+                            "activity_id": new_activity["id"],
+                            "activity_name": new_activity["name"],
+                            "color": new_activity["color"],
+                            "icon": new_activity["icon"],
+                            "category_id": new_activity.get("category_id"),
+                            "category_name": new_activity.get("category_name"),
+                            "category_icon": new_activity.get("category_icon"),
+                            "category_color": new_activity.get("category_color"),
+                            "workspace_id": new_session["workspace_id"],
+                            "workspace_name": new_session["workspace_name"],
+                            "session_start_time": new_session["start_time"],
+                            "previous_activity_id": old_session["activity_id"],
+                            "previous_activity_name": (
+                                old_activity["name"] if old_activity else None
+                            ),
                         },
                     )
-
-        # Detect changed sessions (same session ID, different activity)
-        for session_id in old_sessions_by_id:
-            if session_id in new_sessions_by_id:
-                old_session = old_sessions_by_id[session_id]
-                new_session = new_sessions_by_id[session_id]
-
-                if old_session.get("activity_id") != new_session.get("activity_id"):
-                    old_activity = get_activity(old_session.get("activity_id"))
-                    new_activity = get_activity(new_session.get("activity_id"))
-
-                    if new_activity:
-                        _LOGGER.debug(
-                            "Firing session_changed event in workspace %s: %s -> %s",
-                            new_session["workspace_name"],
-                            old_activity["name"] if old_activity else "unknown",
-                            new_activity["name"],
-                        )
-                        self.hass.bus.async_fire(
-                            EVENT_SESSION_CHANGED,
-                            {
-                                "activity_id": new_activity["id"],
-                                "activity_name": new_activity["name"],
-                                "color": new_activity["color"],
-                                "icon": new_activity["icon"],
-                                "category_id": new_activity.get("category_id"),
-                                "category_name": new_activity.get("category_name"),
-                                "category_icon": new_activity.get("category_icon"),
-                                "category_color": new_activity.get("category_color"),
-                                "workspace_id": new_session["workspace_id"],
-                                "workspace_name": new_session["workspace_name"],
-                                "session_start_time": new_session["start_time"],
-                                "previous_activity_id": old_session["activity_id"],
-                                "previous_activity_name": (
-                                    old_activity["name"] if old_activity else None
-                                ),
-                            },
-                        )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 import logging
 from typing import Any
 
@@ -31,11 +30,25 @@ from .coordinator import (
     Activity,
     DriftBeaconConfigEntry,
     DriftBeaconDataUpdateCoordinator,
+    Session,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _format_duration(seconds: int) -> str:
+    """Format duration in seconds to human-readable string."""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours > 0:
+        return f"{hours}h {minutes}m {secs}s"
+    elif minutes > 0:
+        return f"{minutes}m {secs}s"
+    else:
+        return f"{secs}s"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: DriftBeaconConfigEntry,
@@ -44,22 +57,12 @@ async def async_setup_entry(
     """Set up the Drift Beacon sensor platform."""
     coordinator = entry.runtime_data
 
-    # Extract unique workspaces from activities
-    activities = coordinator.data.get("activities", [])
-    workspaces: dict[str, str] = {}  # workspace_id -> workspace_name
-
-    for activity in activities:
-        workspace_id = activity.get("workspace_id")
-        workspace_name = activity.get("workspace_name")
-        if workspace_id and workspace_name:
-            workspaces[workspace_id] = workspace_name
-
     # Create one live session sensor per workspace
     sensors = [
         DriftBeaconLiveSessionSensor(
             coordinator, entry.entry_id, workspace_id, workspace_name
         )
-        for workspace_id, workspace_name in workspaces.items()
+        for workspace_id, workspace_name in coordinator.workspaces.items()
     ]
 
     if sensors:
@@ -73,6 +76,15 @@ class DriftBeaconLiveSessionSensor(
 ):
     """Sensor representing the live session state for a specific workspace."""
 
+    # Base entity classes keep a __dict__; slots cover the attributes we own
+    __slots__ = (
+        "_config_entry_id",
+        "_workspace_id",
+        "_workspace_name",
+        "_attrs_cache_key",
+        "_attrs_cache_base",
+    )
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -89,6 +101,10 @@ class DriftBeaconLiveSessionSensor(
         self._workspace_id = workspace_id
         self._workspace_name = workspace_name
 
+        # Static attributes of the current session, reused until it changes
+        self._attrs_cache_key: tuple[Any, ...] | None = None
+        self._attrs_cache_base: dict[str, Any] = {}
+
         # Set unique ID for entity registry (include workspace)
         self._attr_unique_id = f"{config_entry_id}_live_session_{workspace_id}"
 
@@ -138,13 +154,15 @@ class DriftBeaconLiveSessionSensor(
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        session = self._get_workspace_session()
+        workspace_id = self._workspace_id
+        workspace_name = self._workspace_name
+        session = self.coordinator.sessions_by_workspace.get(workspace_id)
 
         # If no session in this workspace, return workspace info only
         if session is None:
             return {
-                ATTR_WORKSPACE_ID: self._workspace_id,
-                ATTR_WORKSPACE_NAME: self._workspace_name,
+                ATTR_WORKSPACE_ID: workspace_id,
+                ATTR_WORKSPACE_NAME: workspace_name,
             }
 
         # Find the activity for this session
@@ -154,73 +172,63 @@ class DriftBeaconLiveSessionSensor(
                 "Activity %s not found for live session", session.get("activity_id")
             )
             return {
-                ATTR_WORKSPACE_ID: self._workspace_id,
-                ATTR_WORKSPACE_NAME: self._workspace_name,
+                ATTR_WORKSPACE_ID: workspace_id,
+                ATTR_WORKSPACE_NAME: workspace_name,
             }
 
-        attributes = {
-            ATTR_ACTIVITY_ID: activity["id"],
-            ATTR_ACTIVITY_NAME: activity["name"],
-            ATTR_COLOR: activity["color"],
-            ATTR_ICON: activity["icon"],
-            ATTR_CATEGORY_ID: activity.get("category_id"),
-            ATTR_CATEGORY_NAME: activity.get("category_name"),
-            ATTR_CATEGORY_ICON: activity.get("category_icon"),
-            ATTR_CATEGORY_COLOR: activity.get("category_color"),
-            ATTR_WORKSPACE_ID: self._workspace_id,
-            ATTR_WORKSPACE_NAME: self._workspace_name,
-            ATTR_SESSION_START_TIME: session["start_time"],
-        }
-
-        # Calculate duration if we have a start time
-        if session.get("start_time"):
-            try:
-                start_time = datetime.fromisoformat(
-                    session["start_time"].replace("Z", "+00:00")
-                )
-                duration = (
-                    datetime.now(start_time.tzinfo) - start_time
-                ).total_seconds()
-                duration_seconds = int(duration)
-                attributes[ATTR_SESSION_DURATION] = duration_seconds
-                attributes[ATTR_SESSION_DURATION_FORMATTED] = self._format_duration(
-                    duration_seconds
-                )
-            except (ValueError, TypeError) as err:
-                _LOGGER.debug("Failed to calculate session duration: %s", err)
+        # Only the duration changes while the same session is running. The
+        # activity fields are part of the key so a rename or recolour under the
+        # same ID rebuilds, while an unchanged poll reuses the cached dict.
+        get = activity.get
+        key = (
+            session.get("id"),
+            session.get("start_time"),
+            activity["id"],
+            activity["name"],
+            activity["color"],
+            activity["icon"],
+            get("category_id"),
+            get("category_name"),
+            get("category_icon"),
+            get("category_color"),
+        )
+        if key != self._attrs_cache_key:
+            self._attrs_cache_base = {
+                ATTR_ACTIVITY_ID: activity["id"],
+                ATTR_ACTIVITY_NAME: activity["name"],
+                ATTR_COLOR: activity["color"],
+                ATTR_ICON: activity["icon"],
+                ATTR_CATEGORY_ID: get("category_id"),
+                ATTR_CATEGORY_NAME: get("category_name"),
+                ATTR_CATEGORY_ICON: get("category_icon"),
+                ATTR_CATEGORY_COLOR: get("category_color"),
+                ATTR_WORKSPACE_ID: workspace_id,
+                ATTR_WORKSPACE_NAME: workspace_name,
+                ATTR_SESSION_START_TIME: session["start_time"],
+            }
+            self._attrs_cache_key = key
+
+        attributes = self._attrs_cache_base.copy()
+
+        # Calculate duration if the coordinator parsed a start time
+        start_time = session.get("_start_time_dt")
+        if start_time is not None:
+            duration = (self.coordinator.data["_now_utc"] - start_time).total_seconds()
+            duration_seconds = int(duration)
+            attributes[ATTR_SESSION_DURATION] = duration_seconds
+            attributes[ATTR_SESSION_DURATION_FORMATTED] = _format_duration(
+                duration_seconds
+            )
 
         return attributes
 
-    def _format_duration(self, seconds: int) -> str:
-        """Format duration in seconds to human-readable string."""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-
-        if hours > 0:
-            return f"{hours}h {minutes}m {secs}s"
-        elif minutes > 0:
-            return f"{minutes}m {secs}s"
-        else:
-            return f"{secs}s"
-
-    def _get_workspace_session(self) -> dict[str, Any] | None:
+    def _get_workspace_session(self) -> Session | None:
         """Get the active session for this workspace."""
-        live_sessions = self.coordinator.data.get("live_sessions", [])
-
-        for session in live_sessions:
-            if session.get("workspace_id") == self._workspace_id:
-                return session
-
-        return None
+        return self.coordinator.sessions_by_workspace.get(self._workspace_id)
 
     def _get_activity(self, activity_id: str | None) -> Activity | None:
         """Get activity data by ID."""
         if activity_id is None:
             return None
 
-        activities = self.coordinator.data.get("activities", [])
-        for activity in activities:
-            if activity["id"] == activity_id:
-                return activity
-        return None
+        return self.coordinator.activities_by_id.get(activity_id)
@@ -18,11 +18,13 @@ CONF_HUB_NAME: Final = "hub_name"
 DEFAULT_HOST: Final = "local-drift-beacon"
 DEFAULT_PORT: Final = 9000
 DEFAULT_SCAN_INTERVAL: Final = 3  # seconds
+REQUEST_REFRESH_COOLDOWN: Final = 0.2  # seconds
 
 # API endpoints
 API_SYSTEM_STATUS: Final = "/api/device/status"
 API_AUTH_SIGN_IN: Final = "/api/auth/sign-in/email"
 API_AUTH_CREATE_SERVER_SESSION: Final = "/api/auth/create-server-session"
+API_BOOTSTRAP: Final = "/api/bootstrap"
 API_ACTIVITIES: Final = "/api/activities"
 API_LIVE_SESSION: Final = "/api/live-session"
 API_START_SESSION: Final = "/api/start-session"
@@ -38,10 +40,7 @@ DETECTION_CANDIDATES: Final = [
     ("localhost", 9000),
 ]
 DETECTION_TIMEOUT: Final = 2  # seconds
-PROTOCOL_DETECTION_TIMEOUT: Final = 1.5  # seconds
-
-# Platforms
-PLATFORMS: Final = ["switch", "sensor"]
+DETECTION_RESOLVE_TIMEOUT: Final = 0.5  # seconds
 
 # Events
 EVENT_SESSION_STARTED: Final = "drift_beacon_session_started"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
 import logging
 from typing import Any
 
@@ -48,32 +48,35 @@ async def async_setup_entry(
     @callback
     def _async_add_remove_entities() -> None:
         """Add new entities and remove deleted ones."""
-        activities = coordinator.data["activities"]
+        # Current activities (server filters archived activities)
+        activities_by_id = coordinator.activities_by_id
 
-        # Get current activity IDs (server filters archived activities)
-        current_activity_ids = {activity["id"] for activity in activities}
+        # Nothing added or removed - the common case on every update
+        if activities_by_id.keys() == entities.keys():
+            return
 
-        existing_ids = set(entities.keys())
-        new_ids = current_activity_ids - existing_ids
-        deleted_ids = existing_ids - current_activity_ids
+        deleted_ids = entities.keys() - activities_by_id.keys()
 
-        # Create entities for new activities
+        # Create entities for new activities in the server's order, so entity
+        # IDs of same-named activities are assigned deterministically
         new_entities = []
-        for activity in activities:
-            if activity["id"] in new_ids:
-                entity = DriftBeaconActivitySwitch(
-                    coordinator, activity, entry.entry_id
-                )
-                entities[activity["id"]] = entity
-                new_entities.append(entity)
+        for activity_id, activity in activities_by_id.items():
+            if activity_id in entities:
+                continue
+            entity = DriftBeaconActivitySwitch(coordinator, activity, entry.entry_id)
+            entities[activity_id] = entity
+            new_entities.append(entity)
 
         if new_entities:
             async_add_entities(new_entities)
 
-        # Remove entities for deleted activities
-        for activity_id in deleted_ids:
-            entity = entities.pop(activity_id)
-            hass.async_create_task(entity.async_remove())
+        # Remove entities for deleted activities in a single task
+        if deleted_ids:
+            hass.async_create_task(
+                _async_remove_entities(
+                    [entities.pop(activity_id) for activity_id in deleted_ids]
+                )
+            )
 
     # Add initial entities
     _async_add_remove_entities()
@@ -82,11 +85,19 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_async_add_remove_entities))
 
 
+async def _async_remove_entities(removed: list[DriftBeaconActivitySwitch]) -> None:
+    """Remove switches whose activities no longer exist."""
+    await asyncio.gather(*(entity.async_remove() for entity in removed))
+
+
 class DriftBeaconActivitySwitch(
     CoordinatorEntity[DriftBeaconDataUpdateCoordinator], SwitchEntity
 ):
     """Representation of a Activity as a switch."""
 
+    # A switch only stores IDs; activity and session data come from the coordinator
+    __slots__ = ("_activity_id", "_config_entry_id")
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -115,14 +126,7 @@ class DriftBeaconActivitySwitch(
     @property
     def is_on(self) -> bool:
         """Return true if the activity has an active session."""
-        live_sessions = self.coordinator.data.get("live_sessions", [])
-
-        # Check if any session matches this activity
-        for session in live_sessions:
-            if session.get("activity_id") == self._activity_id:
-                return True
-
-        return False
+        return self._activity_id in self.coordinator.sessions_by_activity_id
 
     @property
     def available(self) -> bool:
@@ -158,24 +162,15 @@ class DriftBeaconActivitySwitch(
         }
 
         # Add session information if this activity is active
-        live_sessions = self.coordinator.data.get("live_sessions", [])
-        for session in live_sessions:
-            if session.get("activity_id") == self._activity_id:
-                attributes[ATTR_SESSION_START_TIME] = session["start_time"]
-
-                # Calculate duration if we have a start time
-                if session.get("start_time"):
-                    try:
-                        start_time = datetime.fromisoformat(
-                            session["start_time"].replace("Z", "+00:00")
-                        )
-                        duration = (
-                            datetime.now(start_time.tzinfo) - start_time
-                        ).total_seconds()
-                        attributes[ATTR_SESSION_DURATION] = int(duration)
-                    except (ValueError, TypeError) as err:
-                        _LOGGER.debug("Failed to calculate session duration: %s", err)
-                break
+        session = self.coordinator.sessions_by_activity_id.get(self._activity_id)
+        if session is not None:
+            attributes[ATTR_SESSION_START_TIME] = session["start_time"]
+
+            # Calculate duration if the coordinator parsed a start time
+            start_time = session.get("_start_time_dt")
+            if start_time is not None:
+                duration = (self.coordinator.data["_now_utc"] - start_time).total_seconds()
+                attributes[ATTR_SESSION_DURATION] = int(duration)
 
         return attributes
 
@@ -194,7 +189,7 @@ class DriftBeaconActivitySwitch(
 
         if not success:
             _LOGGER.error("Failed to start session for activity %s", self._activity_id)
-            # The coordinator already requested a refresh, so state will update
+            # The next scheduled poll will bring state back in line
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off - stop the session for this activity."""
@@ -207,13 +202,7 @@ class DriftBeaconActivitySwitch(
             return
 
         # Only stop if this activity actually has an active session
-        live_sessions = self.coordinator.data.get("live_sessions", [])
-        has_active_session = any(
-            session.get("activity_id") == self._activity_id
-            for session in live_sessions
-        )
-
-        if has_active_session:
+        if self._activity_id in self.coordinator.sessions_by_activity_id:
             workspace_id = activity["workspace_id"]
             success = await self.coordinator.stop_session(self._activity_id, workspace_id)
 
@@ -226,13 +215,7 @@ class DriftBeaconActivitySwitch(
                 "Activity %s does not have active session, nothing to stop",
                 self._activity_id,
             )
-            # Still refresh to ensure state is correct
-            await self.coordinator.async_request_refresh()
 
     def _get_activity(self) -> Activity | None:
         """Get the activity data for this entity."""
-        activities = self.coordinator.data.get("activities", [])
-        for activity in activities:
-            if activity["id"] == self._activity_id:
-                return activity
-        return None
+        return self.coordinator.activities_by_id.get(self._activity_id)